@@ -0,0 +1,55 @@
+-- migrateDB.sql
+-- Upgrades an existing student_db created by an earlier setupDB.sql to the current schema,
+-- keeping every admin and student. New installs run setupDB.sql instead.
+-- DDL statements commit implicitly, so back up the database before running this script:
+--   mysqldump -u root -p student_db > student_db_backup.sql
+--   mysql -u root -p < migrateDB.sql
+USE student_db;
+
+-- admins: usernames become unique and plaintext passwords are replaced by salted scrypt hashes.
+-- Check for duplicate usernames first, the UNIQUE index cannot be added while any remain:
+--   SELECT username FROM admins GROUP BY username HAVING COUNT(*) > 1;
+-- The new NOT NULL columns are filled with their implicit default, all zero bytes.
+ALTER TABLE admins
+    CHANGE password_hash legacy_password VARCHAR(255) NOT NULL,
+    ADD COLUMN password_salt BINARY(16) NOT NULL,
+    ADD COLUMN password_hash BINARY(32) NOT NULL,
+    ADD UNIQUE INDEX username (username);
+
+-- scrypt cannot be computed in SQL, so only the seeded default admin is rehashed here (same values as
+-- setupDB.sql). Every other admin is left with an all-zero salt and hash, which no password matches:
+-- reset them with the salt and hash from studentRegistration.hash_admin_password(), e.g.
+--   UPDATE admins SET password_salt = UNHEX('...'), password_hash = UNHEX('...') WHERE username = '...';
+UPDATE admins
+SET password_salt = UNHEX('a60eae621215494fab2724e1e53ae0eb'),
+    password_hash = UNHEX('e261f359ce81302581d4b8001544ca440f59d7c003cc77aebc7899aa4bb32502')
+WHERE username = 'Apple' AND legacy_password = 'BatmanGokuSuper@12';
+
+ALTER TABLE admins DROP COLUMN legacy_password;
+
+-- students: the primary key becomes the AUTO_INCREMENT id, backfilled from the stored IDs so every
+-- existing S#### ID still maps to the same student (CONCAT('S', 1000 + id) in queries).
+-- Check for duplicate emails first, the UNIQUE index cannot be added while any remain:
+--   SELECT email FROM students GROUP BY email HAVING COUNT(*) > 1;
+ALTER TABLE students ADD COLUMN id INT NULL FIRST;
+UPDATE students SET id = CAST(SUBSTRING(student_id, 2) AS UNSIGNED) - 1000;
+
+-- The ngram full-text index must be built without the default English stopword list (see setupDB.sql)
+SET SESSION innodb_ft_enable_stopword = OFF;
+
+ALTER TABLE students
+    DROP PRIMARY KEY,
+    DROP COLUMN student_id,
+    MODIFY id INT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    ADD UNIQUE INDEX email (email),
+    ADD INDEX idx_active_name (status, name),
+    ADD INDEX idx_active_dept (status, department);
+
+ALTER TABLE students ADD FULLTEXT INDEX ft_name_dept (name, department) WITH PARSER ngram;
+
+-- Data version read by clients to tell whether their cached listings are stale
+CREATE TABLE data_version (
+    id TINYINT PRIMARY KEY,
+    version BIGINT UNSIGNED NOT NULL
+);
+INSERT INTO data_version (id, version) VALUES (1, 0);
@@ -1,28 +1,54 @@
 -- setupDB.sql
 -- Creates the student_db database and required tables for EduEnroll
+-- WARNING: drops any existing student_db first. To upgrade an existing install
+-- without losing its data, run migrateDB.sql instead.
 DROP DATABASE IF EXISTS student_db;
 CREATE DATABASE student_db;
 USE student_db;
 
 CREATE TABLE admins (
     id INT AUTO_INCREMENT PRIMARY KEY,
-    username VARCHAR(50) NOT NULL,
-    password_hash VARCHAR(255) NOT NULL
+    username VARCHAR(50) NOT NULL UNIQUE,  -- Login looks admins up by username
+    password_salt BINARY(16) NOT NULL,  -- Random per-admin salt
+    password_hash BINARY(32) NOT NULL  -- scrypt(password, salt, n=16384, r=8, p=1), see hash_admin_password()
 );
 
+-- The ngram full-text index must be built without the default English stopword list,
+-- otherwise every 2-character token containing a stopword such as 'a' or 'i' is dropped
+SET SESSION innodb_ft_enable_stopword = OFF;
+
 CREATE TABLE students (
-    student_id VARCHAR(10) PRIMARY KEY,
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    -- Student IDs (e.g., S1001) are derived from id as CONCAT('S', 1000 + id) in queries;
+    -- a generated column cannot be based on an AUTO_INCREMENT column
     name VARCHAR(100) NOT NULL,
     age INT,
     gender CHAR(10),
     department VARCHAR(50),
-    email VARCHAR(100),
+    email VARCHAR(100) UNIQUE,  -- Admin CSV imports update the student with a known email
     phone VARCHAR(15),
-    status BOOLEAN DEFAULT TRUE
+    status BOOLEAN DEFAULT TRUE,
+    -- Every lookup filters on status = TRUE, so it leads both composite indexes
+    INDEX idx_active_name (status, name),
+    INDEX idx_active_dept (status, department),
+    FULLTEXT INDEX ft_name_dept (name, department) WITH PARSER ngram
 );
 
--- Insert default admin user
-INSERT INTO admins (username, password_hash) VALUES ('Apple', 'BatmanGokuSuper@12');
+-- Single-row counter bumped as the last statement of every transaction that writes students;
+-- clients compare it to tell whether their cached listings are stale (see _data_version())
+CREATE TABLE data_version (
+    id TINYINT PRIMARY KEY,
+    version BIGINT UNSIGNED NOT NULL
+);
+INSERT INTO data_version (id, version) VALUES (1, 0);
+
+-- Insert default admin user (password stored as a salted scrypt hash). To create or reset an admin, compute
+-- the salt and hash in Python: [part.hex() for part in studentRegistration.hash_admin_password('...')]
+INSERT INTO admins (username, password_salt, password_hash) VALUES (
+    'Apple',
+    UNHEX('a60eae621215494fab2724e1e53ae0eb'),
+    UNHEX('e261f359ce81302581d4b8001544ca440f59d7c003cc77aebc7899aa4bb32502')
+);
 
 -- Note: After running this script, grant privileges to your MySQL user:
 -- GRANT ALL PRIVILEGES ON student_db.* TO 'your_username'@'localhost' IDENTIFIED BY 'your_password';
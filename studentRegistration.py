@@ -1,49 +1,211 @@
 import mysql.connector
+import mysql.connector.pooling
+from mysql.connector.constants import ClientFlag
+from mysql.connector import errorcode
 import getpass
+import hashlib
+import hmac
 import sys
-import re
 import csv
 from datetime import datetime
 import logging
-import subprocess
+import logging.handlers
+import atexit
 import os
 import stat
-import venv
 import platform
+import queue
+from collections import namedtuple, OrderedDict
+from itertools import islice
 
-# Configure logging to track application events and errors
-logging.basicConfig(
-    filename='edu_enroll.log',
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+def _configure_logging():
+    """
+    Configures logging to track application events and errors. Called once from main(),
+    so importing the module neither opens the log file nor starts the listener thread.
+    Records go through a queue to a background listener, which buffers them and
+    writes to the log file in chunks (immediately for errors).
+    """
+    file_handler = logging.FileHandler('edu_enroll.log')
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    buffer = logging.handlers.MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=file_handler)
+    records = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(records, buffer, respect_handler_level=True)
+    listener.start()
+    logging.getLogger().setLevel(logging.INFO)
+    logging.getLogger().addHandler(logging.handlers.QueueHandler(records))
+    # atexit runs in reverse order: drain the queue first, then flush the buffer.
+    # Every exit path, including the KeyboardInterrupt/error handlers' sys.exit(), runs these.
+    atexit.register(buffer.flush)
+    atexit.register(listener.stop)
+
+# Module logger, looked up once; messages use %-style arguments so formatting is deferred
+log = logging.getLogger(__name__)
+
+APP_VERSION = "1.0"
+# Written after a successful setup; delete it (or bump APP_VERSION) to force provisioning again
+SETUP_SENTINEL = ".edu_enroll_setup_ok"
 
 # Hardcoded MySQL credentials (replace with your actual credentials or use env variables in production)
 MYSQL_USER = "root"
 MYSQL_PASSWORD = "BatmanGokuSuper@12"  # REPLACE WITH YOUR MYSQL ROOT PASSWORD
 MYSQL_HOST = "localhost"
 MYSQL_DATABASE = "student_db"
+KEYRING_SERVICE = "edu_enroll"
+MYSQL_POOL_SIZE = 4
+BULK_INSERT_BATCH_SIZE = 10000
+CSV_EXPORT_CHUNK_SIZE = 4096
+CSV_WRITE_BUFFER_SIZE = 1 << 20
+STUDENT_MATCH_LIMIT = 50  # Most students listed for an edit/delete selection
+STUDENT_PAGE_SIZE = 50  # Students shown per page when viewing or searching
+SEARCH_CACHE_SIZE = 64  # Search result pages kept in memory while the table is unchanged
+# scrypt cost parameters for admin passwords; changing them invalidates every stored hash
+ADMIN_SCRYPT_N = 2 ** 14
+ADMIN_SCRYPT_R = 8
+ADMIN_SCRYPT_P = 1
+ADMIN_SALT_SIZE = 16
+ADMIN_HASH_SIZE = 32
+# Salt hashed against for unknown usernames, so a failed lookup costs the same scrypt as a wrong password
+_DUMMY_ADMIN_SALT = bytes(ADMIN_SALT_SIZE)
+NGRAM_TOKEN_SIZE = 2  # MySQL ngram_token_size default for the ft_name_dept index
 
-def setup_environment():
+# Operating system name ("Linux", "Darwin", "Windows"), looked up once for the setup steps
+_SYSTEM = platform.system()
+
+# Accepted gender codes for validation
+_GENDERS = frozenset({'M', 'F', 'OTHER'})
+
+# Row template for numbered student selection lists
+_ROW_FMT = "  {0}. ID: {1} | Name: {2} | Age: {3} | Gender: {4} | Department: {5} | Email: {6} | Phone: {7}\n".format
+
+# Row template for student listings (view and search)
+_LIST_FMT = "[+] ID: {0} | Name: {1} | Department: {2} | Email: {3} | Phone: {4}\n".format
+
+# Characters with special meaning in boolean-mode full-text queries
+_FULLTEXT_OPERATORS = str.maketrans('', '', '+-<>()~*"@')
+
+# SQL for the hottest lookups, executed through server-side prepared cursors so the
+# server parses and plans each statement once per prepare instead of per query
+_STMTS = {
+    "find_by_name": (
+        "SELECT CONCAT('S', 1000 + id) AS student_id, name, age, gender, department, email, phone "
+        "FROM students WHERE status = TRUE AND name LIKE %s ORDER BY name, id LIMIT %s"
+    ),
+    "search_fulltext": (
+        "SELECT CONCAT('S', 1000 + id) AS student_id, name, department, email, phone FROM students "
+        "WHERE status = TRUE AND MATCH(name, department) AGAINST (%s IN BOOLEAN MODE) "
+        "ORDER BY id LIMIT %s OFFSET %s"
+    ),
+    "search_like": (
+        "SELECT CONCAT('S', 1000 + id) AS student_id, name, department, email, phone FROM students "
+        "WHERE status = TRUE AND (name LIKE %s OR department LIKE %s) "
+        "ORDER BY id LIMIT %s OFFSET %s"
+    ),
+    "admin_login": (
+        "SELECT password_salt, password_hash FROM admins WHERE username = %s LIMIT 1"
+    ),
+}
+
+# Insert used by self-registration; the database assigns id, from which student_id is derived.
+# A duplicate email fails with ER_DUP_ENTRY rather than touching the existing student.
+_INSERT_STUDENT = (
+    "INSERT INTO students (name, age, gender, department, email, phone) "
+    "VALUES (%s, %s, %s, %s, %s, %s)"
+)
+
+# Admin-only CSV re-imports are keyed by email: a known email updates (and reactivates) that student
+_UPSERT_STUDENT = (
+    "ON DUPLICATE KEY UPDATE name = new.name, age = new.age, gender = new.gender, "
+    "department = new.department, phone = new.phone, status = TRUE"
+)
+_IMPORT_STUDENT = _INSERT_STUDENT + " AS new " + _UPSERT_STUDENT
+
+# Run last in every transaction that writes students (see _data_version()). The row lock serializes
+# writers, so versions are handed out in commit order and a reader never sees a later version first.
+_BUMP_DATA_VERSION = "UPDATE data_version SET version = version + 1 WHERE id = 1"
+
+# Errors meaning the server or client refuses LOAD DATA LOCAL INFILE:
+# ER_NOT_ALLOWED_COMMAND, ER_CLIENT_LOCAL_FILES_DISABLED, CR_LOAD_DATA_LOCAL_INFILE_REJECTED
+_LOCAL_INFILE_DISABLED = frozenset({1148, 3948, 2068})
+
+# MySQL password for this process; MYSQL_PASSWORD until MySQL rejects it (see _connect_server())
+_mysql_password = None
+
+# Client errors meaning no MySQL server is listening
+_SERVER_UNREACHABLE = frozenset({errorcode.CR_CONNECTION_ERROR, errorcode.CR_CONN_HOST_ERROR})
+
+# Shared connection pool, opened by setup_environment() (or lazily by connect_to_database())
+_POOL = None
+
+# Outcome of a statement applied by execute_write()
+WriteResult = namedtuple("WriteResult", ["lastrowid", "rowcount"])
+
+class StudentCache:
     """
-    Sets up the virtual environment, installs dependencies, and ensures MySQL is running.
-    Creates virtual environment, installs mysql-connector-python, and starts MySQL server if needed.
+    Column-oriented (one list per column) copy of the active student listing used by view_students().
+    Writes made by this process mark it dirty; writes from other sessions are detected by comparing
+    the stored data version (see _data_version()) before each use.
     """
-    print("[+] Setting up environment...")
-    logging.info("Starting environment setup")
+
+    def __init__(self):
+        self.ids = []
+        self.names = []
+        self.depts = []
+        self.emails = []
+        self.phones = []
+        self.version = None
+        self.dirty = True
+
+    def load(self, rows, version):
+        """
+        Replaces the cached columns with freshly fetched (student_id, name, department, email, phone) rows,
+        read at the given data version.
+        """
+        self.ids, self.names, self.depts, self.emails, self.phones = (
+            [list(column) for column in zip(*rows)] if rows else ([], [], [], [], [])
+        )
+        self.version = version
+        self.dirty = False
+
+    def is_current(self, version):
+        return not self.dirty and version == self.version
+
+    def invalidate(self):
+        self.dirty = True
+
+_STUDENT_CACHE = StudentCache()
+
+# (data version, sql, params, offset) -> rows of recently fetched search pages, least recent first
+_SEARCH_CACHE = OrderedDict()
+
+def _data_changed():
+    """
+    Marks cached student data stale. Called after every committed write to the students table.
+    """
+    _STUDENT_CACHE.invalidate()
+
+def _provision_environment():
+    """
+    Creates the virtual environment and installs mysql-connector-python when missing.
+    Only run when the setup sentinel is missing or outdated.
+    """
+    # Imported here so launches that skip provisioning do not pay for them
+    import subprocess
+    import sysconfig
+    import venv
+    from importlib.metadata import distributions
 
     # Check and create virtual environment
     venv_dir = os.path.join(os.getcwd(), "venv")
     if not os.path.exists(venv_dir):
         print("[+] Creating virtual environment...")
         venv.create(venv_dir, with_pip=True)
-        logging.info("Virtual environment created")
+        log.info("Virtual environment created")
     else:
         print("[+] Virtual environment already exists")
-        logging.info("Virtual environment already exists")
+        log.info("Virtual environment already exists")
 
     # Determine activation script based on platform
-    if platform.system() == "Windows":
+    if _SYSTEM == "Windows":
         activate_script = os.path.join(venv_dir, "Scripts", "activate.bat")
         pip_path = os.path.join(venv_dir, "Scripts", "pip")
     else:
@@ -51,110 +213,424 @@ def setup_environment():
         pip_path = os.path.join(venv_dir, "bin", "pip")
 
     # Ensure activation script is executable (Linux/macOS)
-    if platform.system() != "Windows" and os.path.exists(activate_script):
+    if _SYSTEM != "Windows" and os.path.exists(activate_script):
         os.chmod(activate_script, stat.S_IXUSR | stat.S_IRUSR | stat.S_IWUSR)
-        logging.info("Virtual environment activation script set as executable")
+        log.info("Virtual environment activation script set as executable")
     elif not os.path.exists(activate_script):
         print("[+] Error: Virtual environment activation script not found")
-        logging.error("Virtual environment activation script not found")
+        log.error("Virtual environment activation script not found")
         sys.exit(1)
 
-    # Install mysql-connector-python
-    try:
-        subprocess.check_call([pip_path, "install", "mysql-connector-python"])
-        print("[+] Installed mysql-connector-python")
-        logging.info("mysql-connector-python installed")
-    except subprocess.CalledProcessError as e:
-        print(f"[+] Error installing mysql-connector-python: {e}")
-        logging.error(f"Error installing mysql-connector-python: {e}")
-        sys.exit(1)
+    # Install mysql-connector-python into the venv, unless it is already there. The venv's own
+    # site-packages is searched in-process (not this interpreter's, which already imported the
+    # connector), so pip is only spawned when there is something to install.
+    scheme = "venv" if "venv" in sysconfig.get_scheme_names() else ("nt" if os.name == "nt" else "posix_prefix")
+    site_packages = sysconfig.get_path("purelib", scheme, vars={"base": venv_dir, "platbase": venv_dir})
+    connector = next(distributions(name="mysql-connector-python", path=[site_packages]), None)
+    if connector is None:
+        try:
+            subprocess.check_call([pip_path, "install", "mysql-connector-python"])
+            print("[+] Installed mysql-connector-python")
+            log.info("mysql-connector-python installed")
+        except subprocess.CalledProcessError as e:
+            print(f"[+] Error installing mysql-connector-python: {e}")
+            log.error("Error installing mysql-connector-python: %s", e)
+            sys.exit(1)
+    else:
+        print(f"[+] mysql-connector-python {connector.version} already installed")
+        log.info("mysql-connector-python %s already installed", connector.version)
 
-    # Check if MySQL is installed
-    try:
-        subprocess.check_call(["mysql", "--version"])
+def _bootstrap_mysql():
+    """
+    Installs MySQL if the client is missing and starts the server. Only called when the
+    server cannot be reached, so a running server costs no subprocess spawns at startup.
+    """
+    import shutil
+    import subprocess
+
+    # Check if MySQL is installed; a PATH lookup needs no subprocess
+    if shutil.which("mysql") is not None:
         print("[+] MySQL is installed")
-        logging.info("MySQL is installed")
-    except (subprocess.CalledProcessError, FileNotFoundError):
+        log.info("MySQL is installed")
+    else:
         print("[+] MySQL not found. Attempting to install...")
-        logging.warning("MySQL not found, attempting installation")
+        log.warning("MySQL not found, attempting installation")
         try:
-            if platform.system() == "Linux":
+            if _SYSTEM == "Linux":
                 subprocess.check_call(["apt", "update"])
                 subprocess.check_call(["apt", "install", "-y", "mysql-server"])
-            elif platform.system() == "Darwin":  # macOS
+            elif _SYSTEM == "Darwin":  # macOS
                 subprocess.check_call(["brew", "install", "mysql"])
             else:
                 print("[+] Error: MySQL installation not supported on this platform. Please install manually.")
-                logging.error("MySQL installation not supported on this platform")
+                log.error("MySQL installation not supported on this platform")
                 sys.exit(1)
             print("[+] MySQL installed successfully")
-            logging.info("MySQL installed successfully")
+            log.info("MySQL installed successfully")
         except subprocess.CalledProcessError as e:
             print(f"[+] Error installing MySQL: {e}")
-            logging.error(f"Error installing MySQL: {e}")
+            log.error("Error installing MySQL: %s", e)
             sys.exit(1)
 
     # Start MySQL server
     try:
-        if platform.system() == "Linux":
+        if _SYSTEM == "Linux":
             subprocess.check_call(["service", "mysql", "start"])
-        elif platform.system() == "Darwin":
+        elif _SYSTEM == "Darwin":
             subprocess.check_call(["brew", "services", "start", "mysql"])
         print("[+] MySQL server started")
-        logging.info("MySQL server started")
+        log.info("MySQL server started")
     except subprocess.CalledProcessError as e:
         print(f"[+] Warning: Could not start MySQL automatically: {e}")
         print("[+] MySQL may already be running or requires manual start")
-        logging.warning(f"Could not start MySQL: {e}")
+        log.warning("Could not start MySQL: %s", e)
+
+def _connect_server():
+    """
+    Opens a setup connection to the MySQL server without selecting a database.
+    If the server is unreachable, MySQL is bootstrapped and the connection retried once;
+    if MYSQL_PASSWORD is rejected, the password saved in the keyring is tried, then the user is prompted once.
+
+    Returns:
+        mysql.connector.MySQLConnection: Open server connection.
+
+    Raises:
+        mysql.connector.Error: If the server still refuses the connection.
+    """
+    password = get_mysql_password()
+    bootstrapped = keyring_checked = prompted = False
+    while True:
+        try:
+            conn = mysql.connector.connect(host=MYSQL_HOST, user=MYSQL_USER, password=password)
+        except mysql.connector.Error as err:
+            if err.errno in _SERVER_UNREACHABLE and not bootstrapped:
+                log.warning("MySQL server unreachable, bootstrapping: %s", err)
+                _bootstrap_mysql()
+                bootstrapped = True
+            elif err.errno == errorcode.ER_ACCESS_DENIED_ERROR and not keyring_checked:
+                # MYSQL_PASSWORD was rejected: retry with the password saved in the keyring, if any
+                keyring_checked = True
+                saved = load_saved_mysql_password()
+                if saved and saved != password:
+                    log.info("Retrying MySQL connection with the password saved in keyring")
+                    password = saved
+                else:
+                    log.warning("MySQL rejected the configured password for user: %s", MYSQL_USER)
+                    password = prompt_mysql_password()
+                    prompted = True
+            elif err.errno == errorcode.ER_ACCESS_DENIED_ERROR and not prompted:
+                # The saved password was rejected too: ask once, then reuse the answer for the whole run
+                log.warning("MySQL rejected the saved password for user: %s", MYSQL_USER)
+                password = prompt_mysql_password()
+                prompted = True
+            else:
+                raise
+        else:
+            if prompted:
+                save_mysql_password()
+            return conn
+
+def _setup_is_current():
+    """
+    Checks whether a previous launch of this APP_VERSION already provisioned the environment.
+
+    Returns:
+        bool: True if the setup sentinel exists and records the current APP_VERSION.
+    """
+    try:
+        with open(SETUP_SENTINEL, encoding='utf-8') as sentinel:
+            return sentinel.read().strip() == APP_VERSION
+    except OSError:
+        return False
+
+def setup_environment():
+    """
+    Sets up the virtual environment, installs dependencies, and ensures MySQL is running
+    (MySQL is only installed or started when the server cannot be reached).
+    Provisioning is skipped when the setup sentinel shows this version already completed it;
+    the database is always ensured and the shared connection pool opened.
+    """
+    print("[+] Setting up environment...")
+    log.info("Starting environment setup")
+
+    provisioned = _setup_is_current()
+    if provisioned:
+        print("[+] Environment already set up")
+        log.info("Setup sentinel current, skipping provisioning")
+    else:
+        _provision_environment()
 
     # Check if student_db exists, create if not
     try:
-        conn = mysql.connector.connect(
-            host=MYSQL_HOST,
-            user=MYSQL_USER,
-            password=MYSQL_PASSWORD
-        )
+        conn = _connect_server()
         cursor = conn.cursor()
         cursor.execute("CREATE DATABASE IF NOT EXISTS student_db")
         print("[+] Database 'student_db' ensured")
-        logging.info("Database 'student_db' ensured")
+        log.info("Database 'student_db' ensured")
         cursor.close()
         conn.close()
     except mysql.connector.Error as err:
         print(f"[+] Error: Failed to create database: {err}")
-        logging.error(f"Failed to create database: {err}")
+        log.error("Failed to create database: %s", err)
         sys.exit(1)
 
-def connect_to_database():
+    # Open the shared connection pool now that the database exists, so every
+    # later operation reuses an authenticated connection
+    try:
+        get_connection_pool()
+        print("[+] Database connection pool ready")
+    except mysql.connector.Error as err:
+        print(f"[+] Error: Failed to open database connections: {err}")
+        log.error("Failed to create connection pool: %s", err)
+        sys.exit(1)
+
+    # Record the completed setup so later launches skip the subprocess-heavy provisioning
+    if not provisioned:
+        try:
+            with open(SETUP_SENTINEL, 'w', encoding='utf-8') as sentinel:
+                sentinel.write(APP_VERSION)
+        except OSError as e:
+            log.warning("Could not write setup sentinel: %s", e)
+
+def _keyring():
     """
-    Establishes a connection to the MySQL database using hardcoded credentials.
+    Imports the optional keyring package, which remembers a prompted MySQL password between runs.
+    Imported on first use because keyring loads its backends (and importlib.metadata) at import.
 
     Returns:
-        mysql.connector.connection.MySQLConnection: Database connection object.
+        module: The keyring module, or None if it is not installed.
+    """
+    try:
+        import keyring
+        import keyring.errors
+    except ImportError:
+        return None
+    return keyring
 
-    Raises:
-        mysql.connector.Error: If connection fails due to incorrect credentials or database setup.
+def get_mysql_password():
+    """
+    Returns the MySQL password for this process: MYSQL_PASSWORD, unless MySQL rejected it
+    and a password saved in the OS keyring or typed at the prompt replaced it.
+    The keyring is not consulted here, so a normal launch never imports it.
+
+    Returns:
+        str: MySQL password for MYSQL_USER.
+    """
+    global _mysql_password
+    if _mysql_password is None:
+        _mysql_password = MYSQL_PASSWORD
+    return _mysql_password
+
+def load_saved_mysql_password():
     """
+    Replaces the cached MySQL password with the one saved in the OS keyring, when the optional
+    keyring package is installed and has one. Only called after MySQL rejects the current password.
+
+    Returns:
+        str: Saved password, or None if there is none.
+    """
+    global _mysql_password
+    keyring = _keyring()
+    if keyring is None:
+        return None
     try:
-        conn = mysql.connector.connect(
+        saved = keyring.get_password(KEYRING_SERVICE, MYSQL_USER)
+    except keyring.errors.KeyringError as err:
+        log.warning("Could not read MySQL password from keyring: %s", err)
+        return None
+    if saved:
+        _mysql_password = saved
+    return saved
+
+def prompt_mysql_password():
+    """
+    Prompts for the MySQL password and caches it for the rest of the process.
+
+    Returns:
+        str: Password entered by the user.
+    """
+    global _mysql_password
+    _mysql_password = getpass.getpass(f"[+] MySQL password for '{MYSQL_USER}': ")
+    return _mysql_password
+
+def save_mysql_password():
+    """
+    Saves the cached MySQL password to the OS keyring, if available, so later runs skip the prompt.
+    """
+    keyring = _keyring()
+    if keyring is None:
+        return
+    try:
+        keyring.set_password(KEYRING_SERVICE, MYSQL_USER, get_mysql_password())
+        log.info("MySQL password saved to keyring for user: %s", MYSQL_USER)
+    except keyring.errors.KeyringError as err:
+        log.warning("Could not save MySQL password to keyring: %s", err)
+
+def get_connection_pool():
+    """
+    Returns the shared MySQL connection pool, creating it on first use.
+    Reusing pooled connections avoids a fresh TCP handshake and authentication per operation.
+
+    Returns:
+        mysql.connector.pooling.MySQLConnectionPool: Shared connection pool.
+
+    Raises:
+        mysql.connector.Error: If the pool cannot open its connections.
+    """
+    global _POOL
+    if _POOL is None:
+        _POOL = mysql.connector.pooling.MySQLConnectionPool(
+            pool_name="edu",
+            pool_size=MYSQL_POOL_SIZE,
+            # Keep session state between checkouts so server-side prepared statements survive
+            pool_reset_session=False,
+            # Without a session reset an open read transaction would pin an old snapshot
+            # across checkouts, so every statement commits unless a transaction is started
+            autocommit=True,
             host=MYSQL_HOST,
             user=MYSQL_USER,
-            password=MYSQL_PASSWORD,
-            database=MYSQL_DATABASE
+            password=get_mysql_password(),
+            database=MYSQL_DATABASE,
+            # Report matched rather than changed rows, so no-op updates still count as found
+            client_flags=[ClientFlag.FOUND_ROWS],
+            # Discard any unread rows automatically so returning a connection never fails
+            consume_results=True
         )
-        logging.info(f"Connected to database: {MYSQL_DATABASE}")
-        return conn
+        log.info("Connection pool created for database: %s", MYSQL_DATABASE)
+        if not mysql.connector.HAVE_CEXT:
+            log.warning("mysql-connector C extension unavailable, using the pure Python protocol")
+    return _POOL
+
+def close_connection_pool():
+    """
+    Closes every idle connection held by the shared pool. Called once on program exit.
+    """
+    global _POOL
+    if _POOL is not None:
+        _POOL._remove_connections()
+        _POOL = None
+        log.info("Connection pool closed")
+
+def get_prepared_cursor(conn, sql):
+    """
+    Returns a prepared cursor for the given statement, reusing the one already prepared on
+    this connection. Prepared cursors are cached on the underlying connection, so each pooled
+    connection asks the server to parse a statement only once. The cache is dropped whenever
+    the connection has been re-established, since prepared statements do not survive that.
+
+    Args:
+        conn: Connection returned by connect_to_database().
+        sql (str): Statement from _STMTS; pass the same object to cursor.execute().
+
+    Returns:
+        mysql.connector.cursor.MySQLCursorPrepared: Prepared cursor bound to this connection.
+    """
+    cnx = getattr(conn, "_cnx", conn)  # real connection behind a pooled wrapper
+    cache = getattr(cnx, "_edu_prepared", None)
+    if cache is None or cache[0] != cnx.connection_id:
+        cache = cnx._edu_prepared = (cnx.connection_id, {})
+    cursor = cache[1].get(sql)
+    if cursor is None:
+        cursor = cache[1][sql] = conn.cursor(prepared=True)
+    return cursor
+
+def get_cursor(conn):
+    """
+    Returns the plain (unbuffered) cursor shared by every checkout of this connection,
+    creating it on first use. Cursors are cached on the underlying connection so
+    repeated checkouts do not allocate a new cursor per query.
+
+    Args:
+        conn: Connection returned by connect_to_database().
+
+    Returns:
+        mysql.connector.cursor.MySQLCursor: Cursor bound to this connection.
+    """
+    cnx = getattr(conn, "_cnx", conn)  # real connection behind a pooled wrapper
+    cursor = getattr(cnx, "_edu_cursor", None)
+    if cursor is None:
+        cursor = cnx._edu_cursor = conn.cursor()
+    return cursor
+
+def connect_to_database():
+    """
+    Checks out a connection to the MySQL database from the shared connection pool.
+    Calling close() on the returned connection hands it back to the pool.
+
+    Returns:
+        mysql.connector.pooling.PooledMySQLConnection: Pooled database connection object.
+
+    Raises:
+        mysql.connector.Error: If connection fails due to incorrect credentials or database setup.
+    """
+    try:
+        return get_connection_pool().get_connection()
     except mysql.connector.Error as err:
         print(f"[+] Error: Failed to connect to database: {err}")
         print("[+] Ensure MySQL is running and the database 'student_db' exists.")
         print("[+] Run 'setup_database.sql' with your MySQL credentials to create the database and tables.")
         print(f"[+] Example: mysql -u {MYSQL_USER} -p < setup_database.sql")
-        logging.error(f"Failed to connect to database: {err}")
+        log.error("Failed to connect to database: %s", err)
         sys.exit(1)
 
+def execute_write(sql, params):
+    """
+    Runs a single INSERT/UPDATE on a pooled connection and, if it changed any row,
+    bumps the data version in the same transaction.
+
+    Args:
+        sql (str): Parameterized INSERT/UPDATE statement.
+        params (tuple): Statement parameters.
+
+    Returns:
+        WriteResult: lastrowid and rowcount of the statement.
+
+    Raises:
+        mysql.connector.Error: If the statement fails.
+    """
+    conn = connect_to_database()
+    try:
+        cursor = get_cursor(conn)
+        conn.start_transaction()
+        try:
+            cursor.execute(sql, params)
+            result = WriteResult(cursor.lastrowid, cursor.rowcount)
+            if result.rowcount:
+                cursor.execute(_BUMP_DATA_VERSION)
+            conn.commit()
+        except mysql.connector.Error:
+            conn.rollback()
+            raise
+    finally:
+        conn.close()
+    _data_changed()
+    return result
+
+def hash_admin_password(password, salt=None):
+    """
+    Derives the stored form of an admin password with scrypt, a deliberately slow, memory-hard
+    key derivation function, so leaked hashes cannot be brute-forced cheaply.
+
+    Args:
+        password (str): Plaintext password.
+        salt (bytes): Salt stored with the admin, or None to generate a new random one.
+
+    Returns:
+        tuple: (bytes, bytes) - (salt, derived key) for the password_salt and password_hash columns.
+    """
+    if salt is None:
+        salt = os.urandom(ADMIN_SALT_SIZE)
+    return salt, hashlib.scrypt(
+        password.encode('utf-8'), salt=salt,
+        n=ADMIN_SCRYPT_N, r=ADMIN_SCRYPT_R, p=ADMIN_SCRYPT_P, dklen=ADMIN_HASH_SIZE
+    )
+
 def admin_login():
     """
     Authenticates an admin user by checking username and password against the database.
+    The stored salt and scrypt hash are fetched by username, the typed password is hashed
+    with the same salt and compared in constant time, so the password is never sent to the server.
+    Unknown usernames are hashed against a dummy salt, so every failed attempt costs the same.
     Allows up to 3 login attempts before exiting.
 
     Returns:
@@ -170,64 +646,81 @@ def admin_login():
         password = getpass.getpass("[+] Password: ")
         attempts += 1
 
+        # Check out a pooled connection only once the credentials have been typed
+        conn = connect_to_database()
         try:
-            conn = connect_to_database()
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM admins WHERE username = %s AND password_hash = %s", (username, password))
-            result = cursor.fetchone()
-            conn.close()
-
-            if result:
-                print("[+] Login successful.")
-                logging.info(f"Admin {username} logged in successfully")
-                return True
-            else:
-                remaining = max_attempts - attempts
-                print(f"[+] Invalid username or password. {remaining} attempts remaining.")
-                logging.warning(f"Failed login attempt for username: {username}")
-                if remaining == 0:
-                    print("[+] Maximum login attempts exceeded.")
-                    logging.error(f"Admin login failed: maximum attempts exceeded for {username}")
-                    return False
+            sql = _STMTS["admin_login"]
+            cursor = get_prepared_cursor(conn, sql)
+            cursor.execute(sql, (username,))
+            # fetchall() drains the unbuffered prepared result before the connection is returned
+            result = cursor.fetchall()
         except mysql.connector.Error as err:
             print(f"[+] Error: Database error during login: {err}")
-            logging.error(f"Database error during login for {username}: {err}")
+            log.error("Database error during login for %s: %s", username, err)
             return False
+        finally:
+            conn.close()
+
+        # Hash even when the username is unknown, so response time does not reveal which usernames exist
+        salt = bytes(result[0][0]) if result else _DUMMY_ADMIN_SALT
+        derived = hash_admin_password(password, salt)[1]
+        if result and hmac.compare_digest(bytes(result[0][1]), derived):
+            print("[+] Login successful.")
+            log.info("Admin %s logged in successfully", username)
+            return True
+        else:
+            remaining = max_attempts - attempts
+            print(f"[+] Invalid username or password. {remaining} attempts remaining.")
+            log.warning("Failed login attempt for username: %s", username)
+            if remaining == 0:
+                print("[+] Maximum login attempts exceeded.")
+                log.error("Admin login failed: maximum attempts exceeded for %s", username)
+                return False
 
 def validate_student_data(name, age, gender, email, phone):
     """
     Validates student input data to ensure it meets required criteria.
+    A field passed as None is left unchecked (used for partial edits).
 
     Args:
         name (str): Student's full name.
         age (str): Student's age.
-        gender (str): Student's gender.
+        gender (str): Student's gender, already normalized to upper case by the caller.
         email (str): Student's email.
         phone (str): Student's phone number.
 
     Returns:
         tuple: (bool, str) - (True if valid, error message if invalid).
     """
-    if not name or len(name) < 2:
+    if name is not None and len(name) < 2:
         return False, "Name must be at least 2 characters."
-    try:
-        age = int(age)
-        if not 10 <= age <= 100:
-            return False, "Age must be between 10 and 100."
-    except ValueError:
-        return False, "Age must be a valid number."
-    if gender.upper() not in ['M', 'F', 'OTHER']:
+    if age is not None:
+        try:
+            age = int(age)
+            if not 10 <= age <= 100:
+                return False, "Age must be between 10 and 100."
+        except ValueError:
+            return False, "Age must be a valid number."
+    if gender is not None and gender not in _GENDERS:
         return False, "Gender must be M, F, or Other."
-    if not re.match(r"[^@]+@[^@]+\.[^@]+", email):
-        return False, "Invalid email format."
-    if not re.match(r"^\+?\d{10,15}$", phone):
-        return False, "Phone number must be 10-15 digits."
+    if email is not None:
+        # Equivalent to matching r"[^@]+@[^@]+\.[^@]+" without entering the regex engine
+        local, _, domain = email.partition('@')
+        domain = domain.partition('@')[0]
+        if not local or '.' not in domain[1:-1]:
+            return False, "Invalid email format."
+    if phone is not None:
+        # Equivalent to r"\+?\d{10,15}": optional leading '+', then 10-15 decimal digits
+        digits = phone[1:] if phone.startswith('+') else phone
+        if not (10 <= len(digits) <= 15 and digits.isdecimal()):
+            return False, "Phone number must be 10-15 digits."
     return True, ""
 
 def register_student():
     """
     Registers a new student in the database with validated input.
-    Generates a unique student ID based on the current count of students.
+    The unique student ID is derived from the AUTO_INCREMENT id assigned on insert.
+    An already registered email is rejected; it never changes the existing student.
     """
     print("\n[+] Register New Student")
     print("------------------------------------------------------")
@@ -242,122 +735,369 @@ def register_student():
     is_valid, error = validate_student_data(name, age, gender, email, phone)
     if not is_valid:
         print(f"[+] Error: {error}")
-        logging.error(f"Failed student registration: {error}")
+        log.error("Failed student registration: %s", error)
         return
 
     try:
-        conn = connect_to_database()
-        cursor = conn.cursor()
+        # Insert student data; the database assigns the AUTO_INCREMENT id
+        row_id = execute_write(_INSERT_STUDENT, (name, age, gender, department, email, phone)).lastrowid
 
-        # Generate unique student ID (e.g., S1001)
-        cursor.execute("SELECT COUNT(*) FROM students")
-        count = cursor.fetchone()[0] + 1
-        student_id = f"S{1000 + count}"
-
-        # Insert student data
-        cursor.execute(
-            """
-            INSERT INTO students (student_id, name, age, gender, department, email, phone)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-            """,
-            (student_id, name, age, gender, department, email, phone)
-        )
-        conn.commit()
+        # student_id is derived from the id column (e.g., S1001)
+        student_id = f"S{1000 + row_id}"
         print(f"[+] Student registered successfully. Assigned ID: {student_id}")
-        logging.info(f"Student registered: {student_id} - {name}")
+        log.info("Student registered: %s - %s", student_id, name)
     except mysql.connector.Error as err:
+        if err.errno == errorcode.ER_DUP_ENTRY:
+            print(f"[+] Error: A student with email '{email}' is already registered.")
+            log.warning("Duplicate email in student registration: %s", email)
+            return
         print(f"[+] Error: Failed to register student: {err}")
-        logging.error(f"Error registering student {student_id}: {err}")
+        log.error("Error registering student %s: %s", name, err)
+
+def register_students_bulk(rows):
+    """
+    Inserts many already-validated students using multi-row INSERT statements.
+    Rows are sent BULK_INSERT_BATCH_SIZE at a time through cursor.executemany(), which the
+    connector rewrites into a single INSERT ... VALUES (...), (...) statement. All batches run
+    in one transaction, committed once at the end, so the redo log is flushed once per import.
+    Rows with an already registered email update that student.
+
+    Args:
+        rows (list): (name, age, gender, department, email, phone) tuples.
+
+    Returns:
+        int: Number of students inserted or updated.
+
+    Raises:
+        mysql.connector.Error: If a batch fails. The whole import is rolled back.
+    """
+    conn = connect_to_database()
+    try:
+        # A plain cursor: only non-prepared executemany() is rewritten into one multi-row INSERT
+        cursor = get_cursor(conn)
+        conn.start_transaction()
+        try:
+            for start in range(0, len(rows), BULK_INSERT_BATCH_SIZE):
+                cursor.executemany(_IMPORT_STUDENT, rows[start:start + BULK_INSERT_BATCH_SIZE])
+            cursor.execute(_BUMP_DATA_VERSION)
+            conn.commit()
+        except mysql.connector.Error as err:
+            conn.rollback()
+            log.error("Bulk insert of %s rows failed, rolled back: %s", len(rows), err)
+            raise
+        _data_changed()
     finally:
         conn.close()
+    return len(rows)
+
+def import_from_csv(rows):
+    """
+    Loads already-validated students with LOAD DATA LOCAL INFILE, so the server parses the rows
+    directly and no per-row statements are sent. The rows are first written to a temporary CSV
+    file, so the server only ever sees exactly what passed validate_student_data() and never
+    re-parses the user's file (where, e.g., blank lines would load as empty students).
+    The file is loaded into a temporary table and upserted from there in one statement, since
+    LOAD DATA LOCAL would silently skip rows whose email is already registered.
+
+    Args:
+        rows (list): Validated (name, age, gender, department, email, phone) tuples.
+
+    Returns:
+        int: Number of students loaded.
+
+    Raises:
+        IOError: If the temporary file cannot be written.
+        mysql.connector.Error: If the load fails, reports a warning (e.g. a value too long for
+            its column) or local infile is disabled. Nothing is imported.
+    """
+    import tempfile  # Only needed by admin imports
+
+    with tempfile.NamedTemporaryFile('w', newline='', encoding='utf-8', suffix='.csv', delete=False) as file:
+        # Every field is quoted: LOAD DATA reads an unquoted NULL as SQL NULL, an enclosed one as text
+        csv.writer(file, quoting=csv.QUOTE_ALL, lineterminator='\n').writerows(rows)
+    try:
+        # Pooled connections do not enable local infile, so this uses a dedicated connection
+        conn = mysql.connector.connect(
+            host=MYSQL_HOST,
+            user=MYSQL_USER,
+            password=get_mysql_password(),
+            database=MYSQL_DATABASE,
+            allow_local_infile=True
+        )
+        try:
+            cursor = conn.cursor()
+            # Dropped automatically when this connection closes
+            cursor.execute(
+                "CREATE TEMPORARY TABLE students_import (name VARCHAR(100), age INT, gender CHAR(10), "
+                "department VARCHAR(50), email VARCHAR(100), phone VARCHAR(15))"
+            )
+            cursor.execute(
+                "LOAD DATA LOCAL INFILE %s INTO TABLE students_import CHARACTER SET utf8mb4 "
+                "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '' "
+                "LINES TERMINATED BY '\\n' (name, age, gender, department, email, phone)",
+                (file.name,)
+            )
+            loaded = cursor.rowcount
+            if cursor.warning_count:
+                # LOCAL implies IGNORE, so over-long values are truncated with a warning instead of
+                # rejected as register_students_bulk() would; reject the whole import instead
+                cursor.execute("SHOW WARNINGS LIMIT 1")
+                _, code, message = cursor.fetchall()[0]
+                raise mysql.connector.DataError(msg=f"CSV import rejected: {message}", errno=code)
+            cursor.execute(
+                "INSERT INTO students (name, age, gender, department, email, phone) "
+                "SELECT name, age, gender, department, email, phone FROM students_import AS new "
+                + _UPSERT_STUDENT
+            )
+            cursor.execute(_BUMP_DATA_VERSION)
+            conn.commit()
+            _data_changed()
+            return loaded
+        finally:
+            conn.close()
+    finally:
+        os.remove(file.name)
+
+def bulk_register(csv_path):
+    """
+    Registers every valid student listed in a CSV file with the same columns as export_to_csv()
+    (the Student ID column, if present, is ignored). All rows are validated first; the valid rows
+    are then loaded with import_from_csv(), or inserted with register_students_bulk() when
+    local infile is disabled.
+
+    Args:
+        csv_path (str): Path to the CSV file.
+
+    Returns:
+        tuple: (int, int) - (number of students registered, number of rows skipped).
+
+    Raises:
+        IOError: If the file cannot be read.
+        KeyError: If a required column is missing.
+        mysql.connector.Error: If inserting a batch fails.
+    """
+    pending = []
+    skipped = 0
+    with open(csv_path, newline='', encoding='utf-8-sig') as file:
+        reader = csv.DictReader(file)
+        for row in reader:
+            # line_num is the file line the record ends on, counting blank lines and quoted newlines
+            line_no = reader.line_num
+            # Short rows yield None for the missing trailing fields
+            name, age, gender, department, email, phone = (
+                (row[column] or "").strip()
+                for column in ("Name", "Age", "Gender", "Department", "Email", "Phone")
+            )
+            gender = gender.upper()
+            is_valid, error = validate_student_data(name, age, gender, email, phone)
+            if not is_valid:
+                print(f"[+] Skipping line {line_no}: {error}")
+                log.warning("Skipping CSV line %s in %s: %s", line_no, csv_path, error)
+                skipped += 1
+                continue
+            pending.append((name, age, gender, department, email, phone))
+
+    if not pending:
+        log.info("Bulk registration from %s: no valid rows, %s skipped", csv_path, skipped)
+        return 0, skipped
+
+    try:
+        registered = import_from_csv(pending)
+    except mysql.connector.Error as err:
+        if err.errno not in _LOCAL_INFILE_DISABLED:
+            raise
+        log.warning("LOAD DATA LOCAL INFILE unavailable, inserting rows instead: %s", err)
+        registered = register_students_bulk(pending)
+    log.info("Bulk registration from %s: %s registered, %s skipped", csv_path, registered, skipped)
+    return registered, skipped
+
+def import_students_from_csv():
+    """
+    Prompts for a CSV file and registers the students it lists.
+    """
+    print("\n[+] Import Students from CSV")
+    print("------------------------------------------------------")
+    csv_path = input("[+] CSV file path: ").strip()
+    try:
+        registered, skipped = bulk_register(csv_path)
+        print(f"[+] Imported {registered} student(s), skipped {skipped} row(s).")
+    except IOError as err:
+        print(f"[+] Error: Failed to read CSV file: {err}")
+        log.error("Error reading CSV file %s: %s", csv_path, err)
+    except KeyError as err:
+        print(f"[+] Error: CSV file is missing column {err}.")
+        log.error("CSV file %s is missing column %s", csv_path, err)
+    except mysql.connector.Error as err:
+        print(f"[+] Error: Failed to import students: {err}")
+        log.error("Error importing students from %s: %s", csv_path, err)
+
+def _find_students_by_name(name, limit):
+    """
+    Fetches active students whose name starts with the given text, ordered by name.
+    The prefix match is an idx_active_name range scan; only when it finds nothing is the
+    text looked for anywhere in the name, which has to scan every active student.
+    The pooled connection is released before returning, so it is never held across user prompts.
+
+    Args:
+        name (str): Name text entered by the admin.
+        limit (int): Maximum number of rows to return.
+
+    Returns:
+        list: Matching student rows.
+
+    Raises:
+        mysql.connector.Error: If the lookup fails.
+    """
+    conn = connect_to_database()
+    try:
+        sql = _STMTS["find_by_name"]
+        cursor = get_prepared_cursor(conn, sql)
+        cursor.execute(sql, (f"{name}%", limit))
+        rows = cursor.fetchall()
+        if not rows:
+            cursor.execute(sql, (f"%{name}%", limit))
+            rows = cursor.fetchall()
+        return rows
+    finally:
+        conn.close()
+
+def _choose_student(name, action):
+    """
+    Looks up active students whose name starts with (or else contains) the given text, lists them,
+    and lets the admin pick one when there are several matches.
+
+    Args:
+        name (str): Name text entered by the admin.
+        action (str): Operation being performed ("edit" or "delete"), used in log messages.
+
+    Returns:
+        tuple: Selected student row, or None if nothing was found or the selection was invalid.
+
+    Raises:
+        mysql.connector.Error: If the lookup fails.
+    """
+    # One extra row tells us whether the match list was truncated
+    results = _find_students_by_name(name, STUDENT_MATCH_LIMIT + 1)
+
+    if not results:
+        print(f"[+] Error: No active students found matching '{name}'.")
+        log.warning("No active students found for %s with name: %s", action, name)
+        return None
+    if len(results) > STUDENT_MATCH_LIMIT:
+        print(f"[+] Error: More than {STUDENT_MATCH_LIMIT} students match '{name}'. Please enter more of the name.")
+        log.warning("Too many students matched for %s with name: %s", action, name)
+        return None
+
+    print(f"[+] Found {len(results)} matching student(s):")
+    sys.stdout.write("".join(_ROW_FMT(idx, *row) for idx, row in enumerate(results, 1)))
+
+    if len(results) == 1:
+        return results[0]
+
+    selection = input("[+] Select student by number (1-%d): " % len(results))
+    try:
+        choice = int(selection)
+    except ValueError:
+        print("[+] Error: Please enter a valid number.")
+        log.warning("Invalid input for student selection in %s: %s", action, selection)
+        return None
+    if not 1 <= choice <= len(results):
+        print("[+] Error: Invalid selection.")
+        log.warning("Invalid student selection for %s: %s", action, choice)
+        return None
+    return results[choice - 1]
+
+def _is_student_id(text):
+    """
+    Checks whether text looks like a student ID (e.g., S1001) rather than a name.
+    """
+    return text[:1] in ('S', 's') and text[1:].isdecimal()
+
+def _row_id(student_id):
+    """
+    Converts a student ID (e.g., S1001) to the students.id it is derived from.
+    """
+    return int(student_id[1:]) - 1000
+
+def _apply_student_update(student_id, fields):
+    """
+    Updates columns of a single active student.
+    Each column is set with COALESCE, so a value of None keeps the current value
+    and no read of the existing row is needed.
+
+    Args:
+        student_id (str): ID of the student to update.
+        fields (dict): Column name to new value or None. Column names come from code, never from user input.
+
+    Returns:
+        int: Number of matching active students (0 if the ID does not exist or is inactive).
+
+    Raises:
+        mysql.connector.Error: If the update fails.
+    """
+    assignments = ", ".join(f"{column} = COALESCE(%s, {column})" for column in fields)
+    return execute_write(
+        f"UPDATE students SET {assignments} WHERE id = %s AND status = TRUE",
+        (*fields.values(), _row_id(student_id))
+    ).rowcount
 
 def edit_student():
     """
-    Allows an admin to edit an existing student's details by searching for their name.
+    Allows an admin to edit an existing student's details by student ID or by searching for their name.
     Displays matching students, allows selection, and requires confirmation.
+    Fields left blank are kept as-is by the database, so an edit by ID is a single UPDATE.
     """
     print("\n[+] Edit Student")
     print("------------------------------------------------------")
-    name = input("[+] Enter student name (partial or full): ").strip()
+    name = input("[+] Enter student ID, or student name (start of name, part of name, or full): ").strip()
 
     try:
-        conn = connect_to_database()
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT student_id, name, age, gender, department, email, phone FROM students WHERE name LIKE %s AND status = TRUE",
-            (f"%{name}%",)
-        )
-        results = cursor.fetchall()
-
-        if not results:
-            print(f"[+] Error: No active students found matching '{name}'.")
-            logging.warning(f"No active students found for edit with name: {name}")
-            conn.close()
-            return
-
-        print(f"[+] Found {len(results)} matching student(s):")
-        for idx, row in enumerate(results, 1):
-            print(f"  {idx}. ID: {row[0]} | Name: {row[1]} | Age: {row[2]} | Gender: {row[3]} | Department: {row[4]} | Email: {row[5]} | Phone: {row[6]}")
-
-        if len(results) > 1:
-            try:
-                choice = int(input("[+] Select student by number (1-%d): " % len(results)))
-                if not 1 <= choice <= len(results):
-                    print("[+] Error: Invalid selection.")
-                    logging.warning(f"Invalid student selection for edit: {choice}")
-                    conn.close()
-                    return
-            except ValueError:
-                print("[+] Error: Please enter a valid number.")
-                logging.warning(f"Invalid input for student selection in edit: {choice}")
-                conn.close()
-                return
+        if _is_student_id(name):
+            # Known ID: skip the lookup, the UPDATE reports whether the student exists
+            student_id = name.upper()
+            print(f"[+] Selected student ID: {student_id}")
         else:
-            choice = 1
+            selected_student = _choose_student(name, "edit")
+            if selected_student is None:
+                return
+            student_id = selected_student[0]
+            print(f"[+] Selected student: {selected_student[1]} (ID: {student_id})")
 
-        selected_student = results[choice - 1]
-        student_id = selected_student[0]
-        print(f"[+] Selected student: {selected_student[1]} (ID: {student_id})")
         confirm = input("[+] Confirm edit (y/n): ").strip().lower()
         if confirm != 'y':
             print("[+] Edit cancelled.")
-            logging.info(f"Edit cancelled for student ID: {student_id}")
-            conn.close()
+            log.info("Edit cancelled for student ID: %s", student_id)
             return
 
         print("[+] Enter new values (press Enter to keep current value):")
-        name = input("[+] New Name: ").strip() or selected_student[1]
-        age = input("[+] New Age: ").strip() or str(selected_student[2])
-        gender = input("[+] New Gender (M/F/Other): ").strip().upper() or selected_student[3]
-        department = input("[+] New Department: ").strip() or selected_student[4]
-        email = input("[+] New Email: ").strip() or selected_student[5]
-        phone = input("[+] New Phone Number: ").strip() or selected_student[6]
-
-        # Validate input data
+        name = input("[+] New Name: ").strip() or None
+        age = input("[+] New Age: ").strip() or None
+        gender = input("[+] New Gender (M/F/Other): ").strip().upper() or None
+        department = input("[+] New Department: ").strip() or None
+        email = input("[+] New Email: ").strip() or None
+        phone = input("[+] New Phone Number: ").strip() or None
+
+        # Validate the values that were provided
         is_valid, error = validate_student_data(name, age, gender, email, phone)
         if not is_valid:
             print(f"[+] Error: {error}")
-            logging.error(f"Failed student edit for {student_id}: {error}")
-            conn.close()
+            log.error("Failed student edit for %s: %s", student_id, error)
             return
 
-        # Update student data
-        cursor.execute(
-            """
-            UPDATE students
-            SET name = %s, age = %s, gender = %s, department = %s, email = %s, phone = %s
-            WHERE student_id = %s
-            """,
-            (name, int(age), gender, department, email, phone, student_id)
-        )
-        conn.commit()
+        # Update student data; None keeps the current value
+        updated = _apply_student_update(student_id, {
+            "name": name, "age": int(age) if age is not None else None, "gender": gender,
+            "department": department, "email": email, "phone": phone
+        })
+        if not updated:
+            print(f"[+] Error: No active student found with ID '{student_id}'.")
+            log.warning("No active student found for edit with ID: %s", student_id)
+            return
         print(f"[+] Student {student_id} updated successfully.")
-        logging.info(f"Student {student_id} updated by admin")
+        log.info("Student %s updated by admin", student_id)
     except mysql.connector.Error as err:
         print(f"[+] Error: Failed to edit student: {err}")
-        logging.error(f"Error editing student with name '{name}': {err}")
-    finally:
-        conn.close()
+        log.error("Error editing student with name '%s': %s", name, err)
 
 def delete_student():
     """
@@ -366,285 +1106,365 @@ def delete_student():
     """
     print("\n[+] Delete Student")
     print("------------------------------------------------------")
-    name = input("[+] Enter student name (partial or full): ").strip()
+    name = input("[+] Enter student name (start of name, part of name, or full): ").strip()
 
     try:
-        conn = connect_to_database()
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT student_id, name, age, gender, department, email, phone FROM students WHERE name LIKE %s AND status = TRUE",
-            (f"%{name}%",)
-        )
-        results = cursor.fetchall()
-
-        if not results:
-            print(f"[+] Error: No active students found matching '{name}'.")
-            logging.warning(f"No active students found for delete with name: {name}")
-            conn.close()
+        selected_student = _choose_student(name, "delete")
+        if selected_student is None:
             return
 
-        print(f"[+] Found {len(results)} matching student(s):")
-        for idx, row in enumerate(results, 1):
-            print(f"  {idx}. ID: {row[0]} | Name: {row[1]} | Age: {row[2]} | Gender: {row[3]} | Department: {row[4]} | Email: {row[5]} | Phone: {row[6]}")
-
-        if len(results) > 1:
-            try:
-                choice = int(input("[+] Select student by number (1-%d): " % len(results)))
-                if not 1 <= choice <= len(results):
-                    print("[+] Error: Invalid selection.")
-                    logging.warning(f"Invalid student selection for delete: {choice}")
-                    conn.close()
-                    return
-            except ValueError:
-                print("[+] Error: Please enter a valid number.")
-                logging.warning(f"Invalid input for student selection in delete: {choice}")
-                conn.close()
-                return
-        else:
-            choice = 1
-
-        selected_student = results[choice - 1]
         student_id = selected_student[0]
         print(f"[+] Selected student: {selected_student[1]} (ID: {student_id})")
         confirm = input("[+] Confirm deletion (y/n): ").strip().lower()
         if confirm != 'y':
             print("[+] Deletion cancelled.")
-            logging.info(f"Deletion cancelled for student ID: {student_id}")
-            conn.close()
+            log.info("Deletion cancelled for student ID: %s", student_id)
             return
 
-        # Mark student as inactive
-        cursor.execute(
-            "UPDATE students SET status = FALSE WHERE student_id = %s",
-            (student_id,)
-        )
-        conn.commit()
+        # Mark student as inactive; the row may have changed while the admin was confirming
+        if not _apply_student_update(student_id, {"status": False}):
+            print(f"[+] Error: Student {student_id} is no longer active.")
+            log.warning("Student %s was already inactive at delete time", student_id)
+            return
         print(f"[+] Student {student_id} marked as inactive successfully.")
-        logging.info(f"Student {student_id} marked as inactive by admin")
+        log.info("Student %s marked as inactive by admin", student_id)
     except mysql.connector.Error as err:
         print(f"[+] Error: Failed to delete student: {err}")
-        logging.error(f"Error deleting student with name '{name}': {err}")
-    finally:
-        conn.close()
+        log.error("Error deleting student with name '%s': %s", name, err)
 
 def view_students():
     """
-    Displays all active students from the database.
+    Displays all active students from the database, STUDENT_PAGE_SIZE at a time.
+    Served from the in-memory student cache unless the students table has changed since the last load.
     """
     print("\n[+] All Registered Students")
     print("------------------------------------------------------")
     try:
+        cache = _STUDENT_CACHE
         conn = connect_to_database()
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT student_id, name, department, email, phone FROM students WHERE status = TRUE"
-        )
-        results = cursor.fetchall()
+        try:
+            cursor = get_cursor(conn)
+            # Read the version first, so a write committed during the reload is seen next time
+            version = _data_version(cursor)
+            if not cache.is_current(version):
+                cursor.execute(
+                    "SELECT CONCAT('S', 1000 + id) AS student_id, name, department, email, phone "
+                    "FROM students WHERE status = TRUE"
+                )
+                cache.load(cursor.fetchall(), version)
+        finally:
+            conn.close()
 
-        if results:
-            for row in results:
-                print(f"[+] ID: {row[0]} | Name: {row[1]} | Department: {row[2]} | Email: {row[3]} | Phone: {row[4]}")
-        else:
+        total = len(cache.ids)
+        if not total:
             print("[+] No students found.")
-        conn.close()
+            return
+        rows = zip(cache.ids, cache.names, cache.depts, cache.emails, cache.phones)
+        for shown in range(STUDENT_PAGE_SIZE, total + STUDENT_PAGE_SIZE, STUDENT_PAGE_SIZE):
+            sys.stdout.write("".join(_LIST_FMT(*row) for row in islice(rows, STUDENT_PAGE_SIZE)))
+            if shown >= total or not _next_page():
+                break
     except mysql.connector.Error as err:
         print(f"[+] Error: Failed to retrieve students: {err}")
-        logging.error(f"Error retrieving students: {err}")
+        log.error("Error retrieving students: %s", err)
+
+def _data_version(cursor):
+    """
+    Reads the data version, which every transaction writing the students table bumps as its
+    last statement, whichever session runs it. Versions follow commit order, so a cache filled
+    after reading version N is stale exactly when a later read returns anything else.
+
+    Args:
+        cursor: Plain cursor on a checked-out connection.
+
+    Returns:
+        int: Current data version.
+    """
+    cursor.execute("SELECT version FROM data_version WHERE id = 1")
+    # fetchall() drains the unbuffered result before the connection runs its next statement
+    return cursor.fetchall()[0][0]
+
+def _next_page():
+    """
+    Asks whether to show the next page of a listing.
+
+    Returns:
+        bool: True unless the user entered 'q'.
+    """
+    return input("[+] Press Enter for more, or q to stop: ").strip().lower() != 'q'
+
+def _search_page(sql, params, offset):
+    """
+    Fetches one page of search results, plus one extra row that tells whether another page follows.
+    Pages are kept in a small LRU cache keyed by the data version (see _data_version()), so
+    repeating a search costs one primary-key lookup until any session changes the students table.
+    The pooled connection is released before returning, so it is never held across user prompts.
+
+    Args:
+        sql (str): Search statement from _STMTS, ending in LIMIT %s OFFSET %s.
+        params (tuple): Search parameters, without the limit and offset.
+        offset (int): Number of matching rows to skip.
+
+    Returns:
+        list: Up to STUDENT_PAGE_SIZE + 1 matching rows.
+
+    Raises:
+        mysql.connector.Error: If the search fails.
+    """
+    conn = connect_to_database()
+    try:
+        # Read the version before querying, so a write committed mid-query makes this entry stale
+        key = (_data_version(get_cursor(conn)), sql, params, offset)
+        rows = _SEARCH_CACHE.get(key)
+        if rows is not None:
+            _SEARCH_CACHE.move_to_end(key)
+            return rows
+
+        cursor = get_prepared_cursor(conn, sql)
+        cursor.execute(sql, (*params, STUDENT_PAGE_SIZE + 1, offset))
+        rows = cursor.fetchall()
+    finally:
+        conn.close()
+
+    _SEARCH_CACHE[key] = rows
+    if len(_SEARCH_CACHE) > SEARCH_CACHE_SIZE:
+        _SEARCH_CACHE.popitem(last=False)
+    return rows
+
+def build_fulltext_query(keyword):
+    """
+    Converts a search keyword into a boolean-mode full-text query requiring every word.
+    With the ngram parser each word matches anywhere inside the name or department, like LIKE '%word%'.
+
+    Args:
+        keyword (str): Raw search keyword entered by the user.
+
+    Returns:
+        str: Query for MATCH ... AGAINST, or None if a word is too short to be in the full-text index.
+    """
+    words = keyword.translate(_FULLTEXT_OPERATORS).split()
+    if not words or any(len(word) < NGRAM_TOKEN_SIZE for word in words):
+        return None
+    return " ".join(f"+{word}" for word in words)
 
 def search_students():
     """
     Searches for students by name or department (case-insensitive).
+    Uses the ngram ft_name_dept full-text index, falling back to a LIKE scan for single-character words.
+    Results are fetched and shown STUDENT_PAGE_SIZE at a time.
     """
     print("\n[+] Search Students")
     print("------------------------------------------------------")
     keyword = input("[+] Enter name or department: ").strip()
+    fulltext_query = build_fulltext_query(keyword)
 
-    try:
-        conn = connect_to_database()
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT student_id, name, department, email, phone
-            FROM students
-            WHERE (name LIKE %s OR department LIKE %s) AND status = TRUE
-            """,
-            (f"%{keyword}%", f"%{keyword}%")
-        )
-        results = cursor.fetchall()
+    if fulltext_query:
+        sql = _STMTS["search_fulltext"]
+        params = (fulltext_query,)
+    else:
+        sql = _STMTS["search_like"]
+        params = (f"%{keyword}%", f"%{keyword}%")
 
-        if results:
-            for row in results:
-                print(f"[+] ID: {row[0]} | Name: {row[1]} | Department: {row[2]} | Email: {row[3]} | Phone: {row[4]}")
-        else:
-            print("[+] No matching students found.")
-        conn.close()
+    try:
+        offset = 0
+        while True:
+            results = _search_page(sql, params, offset)
+            if not results and not offset:
+                print("[+] No matching students found.")
+                break
+            sys.stdout.write("".join(_LIST_FMT(*row) for row in results[:STUDENT_PAGE_SIZE]))
+            if len(results) <= STUDENT_PAGE_SIZE or not _next_page():
+                break
+            offset += STUDENT_PAGE_SIZE
     except mysql.connector.Error as err:
         print(f"[+] Error: Failed to search students: {err}")
-        logging.error(f"Error searching students with keyword '{keyword}': {err}")
+        log.error("Error searching students with keyword '%s': %s", keyword, err)
 
 def export_to_csv():
     """
     Exports all active students to a CSV file with a timestamped filename.
+    Rows are streamed from an unbuffered cursor in chunks, so memory use does not grow with the table.
     """
     print("\n[+] Export Students to CSV")
     print("------------------------------------------------------")
+    filename = None
+    conn = connect_to_database()
     try:
-        conn = connect_to_database()
-        cursor = conn.cursor()
+        cursor = get_cursor(conn)
         cursor.execute(
-            "SELECT student_id, name, age, gender, department, email, phone FROM students WHERE status = TRUE"
+            "SELECT CONCAT('S', 1000 + id) AS student_id, name, age, gender, department, email, phone "
+            "FROM students WHERE status = TRUE"
         )
-        results = cursor.fetchall()
+        rows = cursor.fetchmany(CSV_EXPORT_CHUNK_SIZE)
 
-        if not results:
+        if not rows:
             print("[+] No students to export.")
-            logging.info("No students found for CSV export")
-            conn.close()
+            log.info("No students found for CSV export")
             return
 
         # Create timestamped filename
         filename = f"students_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        with open(filename, 'w', newline='') as file:
+        with open(filename, 'w', newline='', buffering=CSV_WRITE_BUFFER_SIZE) as file:
             writer = csv.writer(file)
             writer.writerow(["Student ID", "Name", "Age", "Gender", "Department", "Email", "Phone"])
-            writer.writerows(results)
+            while rows:
+                writer.writerows(rows)
+                rows = cursor.fetchmany(CSV_EXPORT_CHUNK_SIZE)
         print(f"[+] Data exported to {filename}")
-        logging.info(f"Data exported to {filename}")
-        conn.close()
+        log.info("Data exported to %s", filename)
     except mysql.connector.Error as err:
         print(f"[+] Error: Failed to export students: {err}")
-        logging.error(f"Error exporting students to CSV: {err}")
+        log.error("Error exporting students to CSV: %s", err)
     except IOError as err:
         print(f"[+] Error: Failed to write to CSV file: {err}")
-        logging.error(f"Error writing to CSV file {filename}: {err}")
+        log.error("Error writing to CSV file %s: %s", filename, err)
+    finally:
+        conn.close()
+
+# Menus and banner rendered once at import time and written with a single call each
+_DIVIDER = "------------------------------------------------------"
+
+_ADMIN_MENU = f"""
+[+] EduEnroll CLI - Admin Menu
+{_DIVIDER}
+1. Edit Student
+2. Delete Student
+3. View All Students
+4. Search Students
+5. Export Student Data to CSV
+6. Return to Main Menu
+7. Exit Program
+8. Import Students from CSV
+{_DIVIDER}
+"""
+
+_STUDENT_MENU = f"""
+[+] EduEnroll CLI - Student Menu
+{_DIVIDER}
+1. Register as Student
+2. View All Students
+3. Search Students
+4. Return to Main Menu
+5. Exit Program
+{_DIVIDER}
+"""
+
+_ROLE_BANNER = f"""
+[+] EduEnroll CLI
+{_DIVIDER}
+EduEnroll is a command-line interface for student registration and management created by Group 11
+{_DIVIDER}
+
+This project is more than code—it's a testament to our growth, a reflection of our dreams, and a step toward changing the world, one solution at a time.
+{_DIVIDER}
+
+Please select your role to continue:
+1. Admin
+2. Student
+3. Exit
+{_DIVIDER}
+"""
 
 def show_admin_menu():
     """
     Displays the command-line interface menu for admin users with a professional layout.
     """
-    print("\n[+] EduEnroll CLI - Admin Menu")
-    print("------------------------------------------------------")
-    print("1. Edit Student")
-    print("2. Delete Student")
-    print("3. View All Students")
-    print("4. Search Students")
-    print("5. Export Student Data to CSV")
-    print("6. Return to Main Menu")
-    print("7. Exit Program")
-    print("------------------------------------------------------")
+    sys.stdout.write(_ADMIN_MENU)
 
 def show_student_menu():
     """
     Displays the command-line interface menu for student users with a professional layout.
     """
-    print("\n[+] EduEnroll CLI - Student Menu")
-    print("------------------------------------------------------")
-    print("1. Register as Student")
-    print("2. View All Students")
-    print("3. Search Students")
-    print("4. Return to Main Menu")
-    print("5. Exit Program")
-    print("------------------------------------------------------")
+    sys.stdout.write(_STUDENT_MENU)
+
+# Menu choice -> handler, built once; _RETURN and _EXIT mark the choices that leave the menu
+_RETURN = object()
+_EXIT = object()
+
+_ADMIN_ACTIONS = {
+    "1": edit_student, "2": delete_student, "3": view_students, "4": search_students,
+    "5": export_to_csv, "6": _RETURN, "7": _EXIT, "8": import_students_from_csv
+}
+
+_STUDENT_ACTIONS = {
+    "1": register_student, "2": view_students, "3": search_students, "4": _RETURN, "5": _EXIT
+}
+
+def run_menu(show_menu, actions, choices, role):
+    """
+    Runs a role's menu loop until the user returns to role selection or exits the program.
+
+    Args:
+        show_menu (callable): Writes the menu.
+        actions (dict): Menu choice to handler, or to the _RETURN / _EXIT sentinels.
+        choices (str): Range of valid choices shown in prompts (e.g., "1-8").
+        role (str): "admin" or "student", used in log messages.
+    """
+    while True:
+        show_menu()
+        choice = input(f"[+] Enter choice ({choices}): ").strip()
+        action = actions.get(choice)
+
+        if action is _RETURN:
+            print("[+] Returning to main menu.")
+            log.info("%s returned to main menu", role.capitalize())
+            return
+        elif action is _EXIT:
+            print("[+] Exiting EduEnroll. Goodbye!")
+            log.info("Program exited normally from %s menu", role)
+            sys.exit(0)
+        elif action is None:
+            print(f"[+] Invalid choice. Please select a valid option ({choices}).")
+            log.warning("Invalid %s menu choice: %s", role, choice)
+        else:
+            action()
 
 def main():
     """
     Main function to run the EduEnroll CLI application.
     Sets up environment, displays role selection, and directs to appropriate menu.
     """
+    _configure_logging()
+
     # Setup environment before running the application
     setup_environment()
 
     while True:
-        print("\n[+] EduEnroll CLI")
-        print("------------------------------------------------------")
-        print("EduEnroll is a command-line interface for student registration and management created by Group 11")
-        print("------------------------------------------------------")
-        print("""
-This project is more than code—it's a testament to our growth, a reflection of our dreams, and a step toward changing the world, one solution at a time.
-------------------------------------------------------
-""")
-        print("Please select your role to continue:")
-        print("1. Admin")
-        print("2. Student")
-        print("3. Exit")
-        print("------------------------------------------------------")
+        sys.stdout.write(_ROLE_BANNER)
         role_choice = input("[+] Enter choice (1, 2, or 3): ").strip()
 
         if role_choice == "1":
             # Admin role requires authentication
             if not admin_login():
                 print("[+] Exiting program due to failed login.")
-                logging.error("Program exited due to failed admin login")
+                log.error("Program exited due to failed admin login")
                 sys.exit(1)
 
-            # Admin menu loop
-            while True:
-                show_admin_menu()
-                choice = input("[+] Enter choice (1-7): ").strip()
-
-                if choice == "1":
-                    edit_student()
-                elif choice == "2":
-                    delete_student()
-                elif choice == "3":
-                    view_students()
-                elif choice == "4":
-                    search_students()
-                elif choice == "5":
-                    export_to_csv()
-                elif choice == "6":
-                    print("[+] Returning to main menu.")
-                    logging.info("Admin returned to main menu")
-                    break
-                elif choice == "7":
-                    print("[+] Exiting EduEnroll. Goodbye!")
-                    logging.info("Program exited normally from admin menu")
-                    sys.exit(0)
-                else:
-                    print("[+] Invalid choice. Please select a valid option (1-7).")
-                    logging.warning(f"Invalid admin menu choice: {choice}")
+            run_menu(show_admin_menu, _ADMIN_ACTIONS, "1-8", "admin")
 
         elif role_choice == "2":
-            # Student menu loop (no login required)
-            while True:
-                show_student_menu()
-                choice = input("[+] Enter choice (1-5): ").strip()
-
-                if choice == "1":
-                    register_student()
-                elif choice == "2":
-                    view_students()
-                elif choice == "3":
-                    search_students()
-                elif choice == "4":
-                    print("[+] Returning to main menu.")
-                    logging.info("Student returned to main menu")
-                    break
-                elif choice == "5":
-                    print("[+] Exiting EduEnroll. Goodbye!")
-                    logging.info("Program exited normally from student menu")
-                    sys.exit(0)
-                else:
-                    print("[+] Invalid choice. Please select a valid option (1-5).")
-                    logging.warning(f"Invalid student menu choice: {choice}")
+            # Student menu (no login required)
+            run_menu(show_student_menu, _STUDENT_ACTIONS, "1-5", "student")
 
         elif role_choice == "3":
             print("[+] Exiting EduEnroll. Goodbye!")
-            logging.info("Program exited normally via role selection")
+            log.info("Program exited normally via role selection")
             sys.exit(0)
 
         else:
             print("[+] Invalid role selection. Please choose 1 (Admin), 2 (Student), or 3 (Exit).")
-            logging.warning(f"Invalid role choice: {role_choice}")
+            log.warning("Invalid role choice: %s", role_choice)
 
 if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
         print("\n[+] Program terminated by user.")
-        logging.info("Program terminated by user")
+        log.info("Program terminated by user")
         sys.exit(0)
     except Exception as e:
         print(f"[+] Unexpected error: {e}")
-        logging.error(f"Unexpected error: {e}")
-        sys.exit(1)
\ No newline at end of file
+        log.error("Unexpected error: %s", e)
+        sys.exit(1)
+    finally:
+        close_connection_pool()
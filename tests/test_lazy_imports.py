@@ -0,0 +1,46 @@
+"""
+Regression guard for startup cost: importing studentRegistration, and resolving the MySQL
+password the way every launch does, must not load the modules that only provisioning,
+MySQL bootstrap, admin CSV imports or the optional keyring need. Those are imported
+inside the functions that use them.
+"""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("mysql.connector")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LAZY_MODULES = frozenset({"venv", "importlib.metadata", "keyring", "subprocess", "shutil", "tempfile"})
+
+# Runs in a fresh interpreter so modules loaded by pytest itself do not hide an eager import.
+# The driver is imported first, so only modules pulled in by studentRegistration are reported.
+PROBE = """
+import json, sys
+import mysql.connector, mysql.connector.pooling
+before = set(sys.modules)
+import studentRegistration
+{steps}
+print(json.dumps(sorted(set(sys.modules) - before)))
+"""
+
+
+def _lazy_modules_loaded(steps=""):
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(steps=steps)],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    loaded = set(json.loads(result.stdout.splitlines()[-1]))
+    return sorted(loaded & LAZY_MODULES)
+
+
+def test_import_defers_setup_only_modules():
+    assert not _lazy_modules_loaded()
+
+
+def test_password_lookup_skips_keyring():
+    assert not _lazy_modules_loaded("studentRegistration.get_mysql_password()")